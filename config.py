@@ -17,10 +17,16 @@ class Config:
     # Supabase
     SUPABASE_URL: str = os.getenv('SUPABASE_URL', '')
     SUPABASE_KEY: str = os.getenv('SUPABASE_KEY', '')
+    SUPABASE_POOL_MAX: int = int(os.getenv('SUPABASE_POOL_MAX', '10'))
+    SUPABASE_TIMEOUT_SECONDS: int = int(os.getenv('SUPABASE_TIMEOUT_SECONDS', '10'))
 
     # Association DID:KEY — base64 of raw 32-byte Ed25519 private key
     ASSOCIATION_PRIVATE_KEY_B64: str = os.getenv('ASSOCIATION_PRIVATE_KEY_B64', '')
 
+    # Route /verify/check through the micro-batching worker thread
+    # (utils/verify_worker.py) — only worth enabling at high QPS
+    VERIFY_WORKER_ENABLED: bool = os.getenv('VERIFY_WORKER_ENABLED', 'False').lower() == 'true'
+
     # Set at runtime by app.py after key bootstrap
     ASSOCIATION_DID: str = ''
     ASSOCIATION_PRIVATE_KEY_BYTES: bytes = b''
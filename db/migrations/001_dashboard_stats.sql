@@ -0,0 +1,29 @@
+-- 001_dashboard_stats.sql
+-- Aggregate everything the admin dashboard needs in a single RPC call.
+-- Apply via the Supabase SQL editor (or psql) before deploying.
+--
+-- The Flask dashboard previously issued three sequential PostgREST
+-- queries (recent credentials, farmer counts, upcoming events), paying
+-- three round-trips per page load. This function returns all of it as
+-- one JSON object, and pushes the counting into Postgres.
+
+create or replace function dashboard_stats()
+returns json
+language sql
+stable
+as $$
+  select json_build_object(
+    'recent_credentials', coalesce((
+      select json_agg(t)
+      from (
+        select claim_id, event_id, issued_at, claimed
+        from vendor_credentials
+        order by issued_at desc
+        limit 20
+      ) t
+    ), '[]'::json),
+    'total_farmers', (select count(*) from registered_farmers),
+    'approved_farmers', (select count(*) filter (where approved) from registered_farmers),
+    'upcoming_events', (select count(*) from market_events where event_date >= current_date)
+  );
+$$;
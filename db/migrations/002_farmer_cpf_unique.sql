@@ -0,0 +1,12 @@
+-- 002_farmer_cpf_unique.sql
+-- Enforce CPF uniqueness in the database instead of a SELECT-then-INSERT
+-- check in the application. Apply via the Supabase SQL editor (or psql).
+--
+-- The register handler used to do a duplicate-check query followed by
+-- the insert: two round-trips plus a race window between them. With the
+-- constraint, the insert itself rejects duplicates atomically and the
+-- handler maps error code 23505 to the "CPF já cadastrado" message.
+-- NULL CPFs are unaffected (UNIQUE allows multiple NULLs).
+
+alter table registered_farmers
+  add constraint uq_farmer_cpf unique (cpf);
@@ -0,0 +1,16 @@
+-- 003_credential_json_jsonb.sql
+-- Store credentials as jsonb instead of text. Apply via the Supabase SQL
+-- editor (or psql) BEFORE deploying the app revision that ships with it:
+-- the app now inserts and reads the credential as a JSON object.
+--
+-- The text column forced a full json.loads of a multi-KB VC on every
+-- GET /api/credentials/<claim_id>. With jsonb, PostgREST returns the
+-- object directly and no client-side parse is needed.
+--
+-- Key order is NOT significant: signature verification re-canonicalizes
+-- the credential dict (sorted keys) before checking the Ed25519
+-- signature, so jsonb's internal key ordering is harmless.
+
+alter table vendor_credentials
+  alter column credential_json type jsonb
+  using credential_json::jsonb;
@@ -0,0 +1,18 @@
+-- 004_indexes.sql
+-- Indexes for the hot lookup paths. Apply via the Supabase SQL editor
+-- (or psql).
+--
+-- vendor_credentials is queried by claim_id (every wallet/API endpoint)
+-- and by event_id (event detail page, already-issued prefetch before
+-- issuance). market_events is filtered by event_date on the dashboard.
+-- Without these, each query is a sequential scan that grows with the
+-- table; with them, O(log N) BTREE lookups.
+
+create unique index if not exists uq_vendor_credentials_claim
+  on vendor_credentials (claim_id);
+
+create index if not exists ix_vendor_credentials_event
+  on vendor_credentials (event_id, farmer_id);
+
+create index if not exists ix_market_events_date
+  on market_events (event_date);
@@ -8,19 +8,39 @@ Provides a web interface for the association admin to:
 """
 
 import io
+import time
 from functools import wraps
-from flask import Blueprint, render_template, request, redirect, url_for, session, flash, send_file
+from flask import Blueprint, render_template, request, redirect, url_for, session, flash, send_file, g
 
 from config import config
+from utils.qr import render_qr_png, QR_CACHE_CONTROL
 
 admin_bp = Blueprint('admin', __name__, url_prefix='/admin')
 
+# The dashboard is refreshed far more often than its counts change.
+# Cache the render context in-process for a few seconds; writes that
+# affect it call invalidate_dashboard_cache() to stay fresh.
+_DASHBOARD_TTL_SECONDS = 15
+_dashboard_cache: dict = {}
+
+
+def invalidate_dashboard_cache() -> None:
+    """Drop the cached dashboard context. Call after any write that
+    changes farmer counts, events or issued credentials."""
+    _dashboard_cache.clear()
+
 
 def require_admin(f):
-    """Decorator: redirect to login if not authenticated."""
+    """Decorator: redirect to login if not authenticated.
+
+    The decision is memoized on flask.g so that, however many times the
+    check runs within one request, the session cookie is decoded once.
+    """
     @wraps(f)
     def decorated(*args, **kwargs):
-        if not session.get('admin_logged_in'):
+        if 'is_admin' not in g:
+            g.is_admin = bool(session.get('admin_logged_in'))
+        if not g.is_admin:
             return redirect(url_for('admin.login'))
         return f(*args, **kwargs)
     return decorated
@@ -56,61 +76,82 @@ def logout():
 def dashboard():
     from utils.database import get_supabase_client
 
+    cached = _dashboard_cache.get('context')
+    if cached and cached[0] > time.time():
+        return render_template('admin/dashboard.html', **cached[1])
+
     credentials = []
     total_farmers = 0
     approved_farmers = 0
     upcoming_events = 0
+    fetched_ok = False
 
     try:
         supabase = get_supabase_client()
 
-        creds_result = supabase.table('vendor_credentials') \
-            .select('claim_id, event_id, issued_at, claimed') \
-            .order('issued_at', desc=True) \
-            .limit(20) \
-            .execute()
-        credentials = creds_result.data or []
-
-        farmers_result = supabase.table('registered_farmers') \
-            .select('id, approved') \
-            .execute()
-        farmers = farmers_result.data or []
-        total_farmers = len(farmers)
-        approved_farmers = sum(1 for f in farmers if f.get('approved'))
-
-        from datetime import date
-        events_result = supabase.table('market_events') \
-            .select('id') \
-            .gte('event_date', date.today().isoformat()) \
-            .execute()
-        upcoming_events = len(events_result.data or [])
+        # Single round-trip: the dashboard_stats() RPC (db/migrations/001)
+        # returns recent credentials plus all counts in one JSON payload.
+        stats = None
+        try:
+            stats = supabase.rpc('dashboard_stats').execute().data
+        except Exception:
+            stats = None  # RPC not deployed yet — fall back to per-table queries
+
+        if stats:
+            credentials = stats.get('recent_credentials') or []
+            total_farmers = stats.get('total_farmers') or 0
+            approved_farmers = stats.get('approved_farmers') or 0
+            upcoming_events = stats.get('upcoming_events') or 0
+        else:
+            creds_result = supabase.table('vendor_credentials') \
+                .select('claim_id, event_id, issued_at, claimed') \
+                .order('issued_at', desc=True) \
+                .limit(20) \
+                .execute()
+            credentials = creds_result.data or []
+
+            # Count in Postgres (HEAD + count='exact') instead of shipping
+            # every row over the wire just to len() it in Python.
+            total_farmers = supabase.table('registered_farmers') \
+                .select('id', count='exact', head=True) \
+                .execute().count or 0
+
+            approved_farmers = supabase.table('registered_farmers') \
+                .select('id', count='exact', head=True) \
+                .eq('approved', True) \
+                .execute().count or 0
+
+            from datetime import date
+            upcoming_events = supabase.table('market_events') \
+                .select('id', count='exact', head=True) \
+                .gte('event_date', date.today().isoformat()) \
+                .execute().count or 0
+
+        fetched_ok = True
 
     except Exception as e:
         flash(f'Erro no banco de dados: {str(e)}', 'error')
 
-    return render_template(
-        'admin/dashboard.html',
-        credentials=credentials,
-        total_farmers=total_farmers,
-        approved_farmers=approved_farmers,
-        upcoming_events=upcoming_events,
-        association_did=config.ASSOCIATION_DID
-    )
+    context = {
+        'credentials': credentials,
+        'total_farmers': total_farmers,
+        'approved_farmers': approved_farmers,
+        'upcoming_events': upcoming_events,
+        'association_did': config.ASSOCIATION_DID,
+    }
+
+    if fetched_ok:
+        _dashboard_cache['context'] = (time.time() + _DASHBOARD_TTL_SECONDS, context)
+
+    return render_template('admin/dashboard.html', **context)
 
 
 @admin_bp.route('/qr/<claim_id>')
 @require_admin
 def qr_code(claim_id: str):
-    """Return QR code PNG for the claim URL."""
-    import qrcode
+    """Return QR code PNG for the claim URL (cached, browser-cacheable)."""
     claim_url = request.host_url.rstrip('/') + f'/wallet/claim/{claim_id}'
 
-    qr = qrcode.QRCode(box_size=8, border=2)
-    qr.add_data(claim_url)
-    qr.make(fit=True)
-    img = qr.make_image(fill_color='#2E7D32', back_color='white')
-
-    buf = io.BytesIO()
-    img.save(buf, format='PNG')
-    buf.seek(0)
-    return send_file(buf, mimetype='image/png')
+    response = send_file(io.BytesIO(render_qr_png(claim_url)), mimetype='image/png')
+    response.headers['Cache-Control'] = QR_CACHE_CONTROL
+    return response
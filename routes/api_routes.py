@@ -8,10 +8,13 @@ Endpoints:
     POST /api/verify                           - Verify credential (JSON)
 """
 
-import json as json_module
+import io
 from functools import wraps
 from flask import Blueprint, request, jsonify, send_file
 
+from routes.admin_routes import invalidate_dashboard_cache
+from utils.qr import render_qr_png, QR_CACHE_CONTROL
+
 api_bp = Blueprint('api', __name__, url_prefix='/api')
 
 
@@ -45,18 +48,14 @@ def get_credential(claim_id: str):
     if not result.data:
         raise ClaimNotFoundError()
 
-    row = result.data[0]
-    credential = json_module.loads(row['credential_json']) \
-        if isinstance(row['credential_json'], str) else row['credential_json']
-
-    return jsonify({"credential": credential})
+    # credential_json is jsonb (db/migrations/003): PostgREST returns the
+    # object directly, no client-side parse.
+    return jsonify({"credential": result.data[0]['credential_json']})
 
 
 @api_bp.route('/credentials/<claim_id>/qr-verify', methods=['GET'])
 @handle_errors
 def qr_verify(claim_id: str):
-    import io
-    import qrcode
     from utils.database import get_supabase_client
 
     supabase = get_supabase_client()
@@ -70,15 +69,9 @@ def qr_verify(claim_id: str):
 
     verify_url = request.host_url.rstrip('/') + f'/verify?claim={claim_id}'
 
-    qr = qrcode.QRCode(box_size=8, border=2, error_correction=qrcode.constants.ERROR_CORRECT_M)
-    qr.add_data(verify_url)
-    qr.make(fit=True)
-    img = qr.make_image(fill_color='#2E7D32', back_color='white')
-
-    buf = io.BytesIO()
-    img.save(buf, format='PNG')
-    buf.seek(0)
-    return send_file(buf, mimetype='image/png')
+    response = send_file(io.BytesIO(render_qr_png(verify_url)), mimetype='image/png')
+    response.headers['Cache-Control'] = QR_CACHE_CONTROL
+    return response
 
 
 @api_bp.route('/credentials/<claim_id>/claim', methods=['POST'])
@@ -101,6 +94,8 @@ def claim_credential(claim_id: str):
             'claimed': True,
             'claimed_at': datetime.now(timezone.utc).isoformat()
         }).eq('claim_id', claim_id).execute()
+        # Claim status shows up in the dashboard's recent-credentials table.
+        invalidate_dashboard_cache()
 
     return jsonify({"success": True})
 
@@ -12,7 +12,7 @@ Routes:
 from functools import wraps
 from flask import Blueprint, render_template, request, redirect, url_for, session, flash
 
-from routes.admin_routes import require_admin
+from routes.admin_routes import require_admin, invalidate_dashboard_cache
 
 farmer_bp = Blueprint('farmers', __name__, url_prefix='/farmers')
 
@@ -44,31 +44,32 @@ def register():
         try:
             from utils.did_key import generate_did_key
             from utils.database import get_supabase_client
+            from postgrest.exceptions import APIError
 
             supabase = get_supabase_client()
 
-            # Block duplicate CPF
-            if cpf:
-                existing = supabase.table('registered_farmers') \
-                    .select('id') \
-                    .eq('cpf', cpf) \
-                    .execute()
-                if existing.data:
-                    flash(f'CPF {cpf} já está cadastrado', 'error')
-                    return render_template('farmers/register.html')
-
             did, _priv_bytes = generate_did_key()
             multibase = did[len("did:key:"):]
 
-            supabase.table('registered_farmers').insert({
-                'name': name,
-                'cpf': cpf or None,
-                'did': did,
-                'public_key_multibase': multibase,
-                'products': products,
-                'approved': False
-            }).execute()
+            # Duplicate CPFs are rejected by the unique constraint
+            # (db/migrations/002): one atomic round-trip, no race window
+            # between a pre-check and the insert.
+            try:
+                supabase.table('registered_farmers').insert({
+                    'name': name,
+                    'cpf': cpf or None,
+                    'did': did,
+                    'public_key_multibase': multibase,
+                    'products': products,
+                    'approved': False
+                }).execute()
+            except APIError as e:
+                if getattr(e, 'code', None) == '23505':  # unique_violation
+                    flash(f'CPF {cpf} já está cadastrado', 'error')
+                    return render_template('farmers/register.html')
+                raise
 
+            invalidate_dashboard_cache()
             flash(f'Agricultor {name} registrado. DID: {did[:30]}...', 'success')
             return redirect(url_for('farmers.list_farmers'))
 
@@ -85,8 +86,9 @@ def list_farmers():
     farmers = []
     try:
         supabase = get_supabase_client()
+        # Only the columns the list template renders — no select('*').
         result = supabase.table('registered_farmers') \
-            .select('*') \
+            .select('id, name, cpf, did, products, approved') \
             .order('created_at', desc=True) \
             .execute()
         farmers = result.data or []
@@ -103,6 +105,7 @@ def approve(farmer_id: str):
         from utils.database import get_supabase_client
         supabase = get_supabase_client()
         supabase.table('registered_farmers').update({'approved': True}).eq('id', farmer_id).execute()
+        invalidate_dashboard_cache()
         flash('Agricultor aprovado com sucesso', 'success')
     except Exception as e:
         flash(f'Erro: {str(e)}', 'error')
@@ -116,6 +119,7 @@ def reject(farmer_id: str):
         from utils.database import get_supabase_client
         supabase = get_supabase_client()
         supabase.table('registered_farmers').update({'approved': False}).eq('id', farmer_id).execute()
+        invalidate_dashboard_cache()
         flash('Agricultor desativado', 'success')
     except Exception as e:
         flash(f'Erro: {str(e)}', 'error')
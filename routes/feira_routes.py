@@ -9,9 +9,11 @@ Routes:
     POST /events/<event_id>/issue    - Issue credentials for all approved farmers
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
 from flask import Blueprint, render_template, request, redirect, url_for, flash
 
-from routes.admin_routes import require_admin
+from routes.admin_routes import require_admin, invalidate_dashboard_cache
 
 feira_bp = Blueprint('events', __name__, url_prefix='/events')
 
@@ -23,8 +25,10 @@ def list_events():
     events = []
     try:
         supabase = get_supabase_client()
+        # Only the columns the list template renders — no select('*').
         result = supabase.table('market_events') \
-            .select('*') \
+            .select('id, name, event_date, municipality, state, '
+                    'opening_time, closing_time, valid_until') \
             .order('event_date', desc=True) \
             .execute()
         events = result.data or []
@@ -65,6 +69,7 @@ def create():
             }).execute()
 
             event_id = result.data[0]['id']
+            invalidate_dashboard_cache()
             flash(f'Evento "{name}" criado com sucesso', 'success')
             return redirect(url_for('events.event_detail', event_id=event_id))
 
@@ -86,24 +91,40 @@ def event_detail(event_id: str):
     try:
         supabase = get_supabase_client()
 
-        ev_result = supabase.table('market_events').select('*').eq('id', event_id).execute()
+        # The three queries are independent — run them concurrently so the
+        # page waits roughly one round-trip instead of three.
+        def fetch_event():
+            return supabase.table('market_events') \
+                .select('id, name, event_date, municipality, state, '
+                        'opening_time, closing_time, valid_from, valid_until') \
+                .eq('id', event_id) \
+                .execute()
+
+        def fetch_farmers():
+            return supabase.table('registered_farmers') \
+                .select('id, name, products, did, approved') \
+                .eq('approved', True) \
+                .execute()
+
+        def fetch_credentials():
+            return supabase.table('vendor_credentials') \
+                .select('claim_id, farmer_id, stall_number, issued_at, claimed') \
+                .eq('event_id', event_id) \
+                .execute()
+
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            ev_future = pool.submit(fetch_event)
+            farmers_future = pool.submit(fetch_farmers)
+            creds_future = pool.submit(fetch_credentials)
+            ev_result = ev_future.result()
+            farmers = farmers_future.result().data or []
+            issued_credentials = creds_future.result().data or []
+
         if not ev_result.data:
             flash('Evento não encontrado', 'error')
             return redirect(url_for('events.list_events'))
         event = ev_result.data[0]
 
-        farmers_result = supabase.table('registered_farmers') \
-            .select('id, name, products, did, approved') \
-            .eq('approved', True) \
-            .execute()
-        farmers = farmers_result.data or []
-
-        creds_result = supabase.table('vendor_credentials') \
-            .select('claim_id, farmer_id, stall_number, issued_at, claimed') \
-            .eq('event_id', event_id) \
-            .execute()
-        issued_credentials = creds_result.data or []
-
     except Exception as e:
         flash(f'Erro: {str(e)}', 'error')
 
@@ -123,19 +144,33 @@ def event_detail(event_id: str):
 def issue_credentials(event_id: str):
     """Issue VendorAccessCredentials for selected (or all) approved farmers."""
     from utils.database import get_supabase_client
-    from utils.credential_feira import create_vendor_access_credential, generate_claim_id, credential_to_json
+    from utils.credential_feira import create_vendor_access_credentials_bulk, generate_claim_id
 
     try:
         supabase = get_supabase_client()
 
-        ev_result = supabase.table('market_events').select('*').eq('id', event_id).execute()
+        ev_result = supabase.table('market_events') \
+            .select('name, event_date, municipality, state, '
+                    'opening_time, closing_time, valid_until') \
+            .eq('id', event_id) \
+            .execute()
         if not ev_result.data:
             flash('Evento não encontrado', 'error')
             return redirect(url_for('events.list_events'))
         event = ev_result.data[0]
 
         farmer_ids = request.form.getlist('farmer_ids')
-        stall_numbers = request.form.to_dict()
+
+        # Index the form once by farmer id instead of probing the MultiDict
+        # with f-string keys on every loop iteration.
+        stalls_by_farmer = {
+            k[len('stall_'):]: v
+            for k, v in request.form.items() if k.startswith('stall_')
+        }
+        products_by_farmer = {
+            k[len('products_'):]: v.strip()
+            for k, v in request.form.items() if k.startswith('products_')
+        }
 
         if not farmer_ids:
             farmers_result = supabase.table('registered_farmers') \
@@ -150,44 +185,73 @@ def issue_credentials(event_id: str):
                 .execute()
             all_farmers = farmers_result.data or []
 
-        issued = 0
+        # One query up front for farmers who already hold a credential for
+        # this event; they are skipped in the loop instead of double-issued.
+        existing_result = supabase.table('vendor_credentials') \
+            .select('farmer_id') \
+            .eq('event_id', event_id) \
+            .execute()
+        already_issued = {r['farmer_id'] for r in existing_result.data or []}
+
+        # Event-level fields are identical for every farmer in this batch —
+        # resolve them once instead of per iteration.
+        event_kwargs = {
+            'event_name': event['name'],
+            'event_date': event['event_date'],
+            'municipality': event['municipality'],
+            'state': event['state'],
+            'opening_time': event.get('opening_time', '06:00'),
+            'closing_time': event.get('closing_time', '14:00'),
+            'valid_until': event['valid_until'],
+        }
+
+        # Collect the per-farmer subjects first, then create + sign the
+        # whole batch in one call (shared timestamp and signing key).
+        subjects = []
+        farmer_rows = []
         for i, farmer in enumerate(all_farmers):
-            stall_key = f"stall_{farmer['id']}"
-            stall_number = stall_numbers.get(stall_key, str(i + 1))
-            claim_id = generate_claim_id()
+            if farmer['id'] in already_issued:
+                continue
+
+            fid = str(farmer['id'])
+            stall_number = stalls_by_farmer.get(fid, str(i + 1))
 
             # Products can be overridden per event in the issuance form
-            products_raw = request.form.get(f"products_{farmer['id']}", '').strip()
+            products_raw = products_by_farmer.get(fid, '')
             if products_raw:
                 products = [p.strip() for p in products_raw.split(',') if p.strip()]
             else:
                 products = farmer.get('products') or []
 
-            credential = create_vendor_access_credential(
-                claim_id=claim_id,
-                farmer_did=farmer['did'],
-                farmer_name=farmer['name'],
-                stall_number=stall_number,
-                products=products,
-                event_name=event['name'],
-                event_date=event['event_date'],
-                municipality=event['municipality'],
-                state=event['state'],
-                opening_time=event.get('opening_time', '06:00'),
-                closing_time=event.get('closing_time', '14:00'),
-                valid_until=event['valid_until']
-            )
-
-            supabase.table('vendor_credentials').insert({
-                'claim_id': claim_id,
+            subjects.append({
+                'claim_id': generate_claim_id(),
+                'farmer_did': farmer['did'],
+                'farmer_name': farmer['name'],
+                'stall_number': stall_number,
+                'products': products,
+            })
+            farmer_rows.append(farmer)
+
+        credentials = create_vendor_access_credentials_bulk(subjects, **event_kwargs)
+
+        # One insert for the whole batch: a single PostgREST round-trip,
+        # and all-or-nothing on failure.
+        rows = [
+            {
+                'claim_id': subject['claim_id'],
                 'farmer_id': farmer['id'],
                 'event_id': event_id,
-                'stall_number': stall_number,
-                'credential_json': credential_to_json(credential)
-            }).execute()
-            issued += 1
+                'stall_number': subject['stall_number'],
+                'credential_json': credential  # jsonb column (db/migrations/003)
+            }
+            for subject, farmer, credential in zip(subjects, farmer_rows, credentials)
+        ]
+
+        if rows:
+            supabase.table('vendor_credentials').insert(rows).execute()
+            invalidate_dashboard_cache()
 
-        flash(f'{issued} credencial(is) emitida(s) com sucesso', 'success')
+        flash(f'{len(rows)} credencial(is) emitida(s) com sucesso', 'success')
 
     except Exception as e:
         flash(f'Erro ao emitir credenciais: {str(e)}', 'error')
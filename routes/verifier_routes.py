@@ -7,11 +7,15 @@ Verification resolves DID:KEY offline (no HTTP calls required).
 Routes:
     GET  /verify/        - Verifier landing page (gate app)
     POST /verify/check   - Verify credential signature + expiration
+    POST /verify/batch   - Verify several credentials in one request
 """
 
 from flask import Blueprint, render_template, request, jsonify
 
-from utils.crypto import verify_credential_signature, is_credential_expired
+from config import config
+from utils.crypto import (
+    verify_credential_signature, verify_credentials_batch, is_credential_expired
+)
 from utils.did_key import resolve_did_key
 
 verifier_bp = Blueprint('verifier', __name__, url_prefix='/verify')
@@ -74,8 +78,14 @@ def check_credential():
         if not public_key_multibase:
             return jsonify({'valid': False, 'error': 'Chave pública não encontrada'}), 200
 
-        # Verify Ed25519 signature
-        signature_valid = verify_credential_signature(credential, public_key_multibase)
+        # Verify Ed25519 signature — optionally via the micro-batching
+        # worker so concurrent checks share a batch instead of each
+        # occupying a Flask worker for a full verify.
+        if config.VERIFY_WORKER_ENABLED:
+            from utils.verify_worker import submit_verification
+            signature_valid = submit_verification(credential, public_key_multibase).result()
+        else:
+            signature_valid = verify_credential_signature(credential, public_key_multibase)
 
         # Check expiration — just as important as signature for 24-48h credentials
         expired = is_credential_expired(credential)
@@ -125,3 +135,83 @@ def check_credential():
 
     except Exception as e:
         return jsonify({'error': f'Erro interno: {str(e)}'}), 500
+
+
+@verifier_bp.route('/batch', methods=['POST'])
+def check_credentials_batch():
+    """
+    Verify several VendorAccessCredentials in one request.
+
+    Useful when a group of farmers arrives at the gate together: one
+    round-trip instead of one POST per credential, and the shared issuer
+    key is resolved once for the whole batch.
+
+    Accepts JSON body: { "credentials": [ { ...W3C VC... }, ... ] }
+
+    Returns { "results": [ {valid, signatureValid, expired, message}, ... ] }
+    aligned with the input order.
+    """
+    try:
+        data = request.get_json(silent=True)
+        if not data:
+            return jsonify({'error': 'JSON é necessário no corpo da solicitação'}), 400
+
+        credentials = data.get('credentials')
+        if not isinstance(credentials, list) or not credentials:
+            return jsonify({'error': 'Nenhuma credencial fornecida'}), 400
+
+        results = []
+        verifiable = []   # (index, credential, public_key_multibase)
+
+        for credential in credentials:
+            issuer_did = credential.get('issuer', '') if isinstance(credential, dict) else ''
+            if not issuer_did.startswith("did:key:"):
+                results.append({
+                    'valid': False,
+                    'signatureValid': False,
+                    'expired': False,
+                    'message': 'Método DID inválido'
+                })
+                continue
+
+            try:
+                did_document = resolve_did_key(issuer_did)
+                public_key_multibase = did_document['verificationMethod'][0]['publicKeyMultibase']
+            except Exception:
+                results.append({
+                    'valid': False,
+                    'signatureValid': False,
+                    'expired': False,
+                    'message': 'DID inválido'
+                })
+                continue
+
+            verifiable.append((len(results), credential, public_key_multibase))
+            results.append(None)  # filled in after batch verify
+
+        signature_results = verify_credentials_batch(
+            [(credential, mb) for _, credential, mb in verifiable]
+        )
+
+        for (index, credential, _), signature_valid in zip(verifiable, signature_results):
+            expired = is_credential_expired(credential)
+            is_valid = signature_valid and not expired
+
+            if not signature_valid:
+                message = 'Assinatura inválida — credencial falsificada ou adulterada'
+            elif expired:
+                message = 'Credencial expirada — não é válida para este evento'
+            else:
+                message = 'Credencial válida'
+
+            results[index] = {
+                'valid': is_valid,
+                'signatureValid': signature_valid,
+                'expired': expired,
+                'message': message
+            }
+
+        return jsonify({'results': results})
+
+    except Exception as e:
+        return jsonify({'error': f'Erro interno: {str(e)}'}), 500
@@ -5,10 +5,13 @@ from datetime import datetime, timezone, timedelta
 
 from utils.did_key import generate_did_key, resolve_did_key
 from utils.crypto import (
-    sign_credential, verify_credential_signature,
-    is_credential_expired, private_key_from_bytes
+    sign_credential, verify_credential_signature, verify_credentials_batch,
+    verify_credentials_parallel, is_credential_expired, private_key_from_bytes
+)
+from utils.credential_feira import (
+    create_vendor_access_credential, create_vendor_access_credentials_bulk,
+    generate_claim_id
 )
-from utils.credential_feira import create_vendor_access_credential, generate_claim_id
 
 
 @pytest.fixture(autouse=True)
@@ -154,6 +157,134 @@ class TestSignatureVerification:
         assert verify_credential_signature(cred, public_key_multibase) is False
 
 
+class TestCreateVendorAccessCredentialsBulk:
+    @pytest.fixture
+    def subjects(self):
+        return [
+            {
+                'claim_id': generate_claim_id(),
+                'farmer_did': generate_did_key()[0],
+                'farmer_name': f'Agricultor {i}',
+                'stall_number': str(i + 1),
+                'products': ['Mel'],
+            }
+            for i in range(3)
+        ]
+
+    @pytest.fixture
+    def bulk_credentials(self, subjects, valid_until_future):
+        return create_vendor_access_credentials_bulk(
+            subjects,
+            event_name='Feira Orgânica de Lavras',
+            event_date='2024-06-07',
+            municipality='Lavras',
+            state='MG',
+            opening_time='06:00',
+            closing_time='14:00',
+            valid_until=valid_until_future
+        )
+
+    def test_one_credential_per_subject(self, bulk_credentials, subjects):
+        assert len(bulk_credentials) == len(subjects)
+        for cred, subject in zip(bulk_credentials, subjects):
+            assert cred['credentialSubject']['id'] == subject['farmer_did']
+            assert cred['credentialSubject']['stallNumber'] == subject['stall_number']
+
+    def test_shared_issuance_date(self, bulk_credentials):
+        dates = {c['issuanceDate'] for c in bulk_credentials}
+        assert len(dates) == 1
+
+    def test_all_signatures_verify(self, bulk_credentials):
+        for cred in bulk_credentials:
+            doc = resolve_did_key(cred['issuer'])
+            multibase = doc['verificationMethod'][0]['publicKeyMultibase']
+            assert verify_credential_signature(cred, multibase) is True
+
+    def test_event_blocks_are_independent(self, bulk_credentials):
+        bulk_credentials[0]['credentialSubject']['event']['name'] = 'Outra Feira'
+        assert bulk_credentials[1]['credentialSubject']['event']['name'] == 'Feira Orgânica de Lavras'
+
+    def test_empty_subjects(self, valid_until_future):
+        assert create_vendor_access_credentials_bulk(
+            [],
+            event_name='F', event_date='2024-06-07', municipality='L',
+            state='MG', opening_time='06:00', closing_time='14:00',
+            valid_until=valid_until_future
+        ) == []
+
+
+class TestVerifyCredentialsBatch:
+    def test_empty_batch(self):
+        assert verify_credentials_batch([]) == []
+
+    def test_all_valid(self, sample_credential):
+        issuer_did = sample_credential['issuer']
+        doc = resolve_did_key(issuer_did)
+        public_key_multibase = doc['verificationMethod'][0]['publicKeyMultibase']
+
+        results = verify_credentials_batch([(sample_credential, public_key_multibase)] * 3)
+        assert results == [True, True, True]
+
+    def test_mixed_batch_preserves_order(self, sample_credential):
+        issuer_did = sample_credential['issuer']
+        doc = resolve_did_key(issuer_did)
+        public_key_multibase = doc['verificationMethod'][0]['publicKeyMultibase']
+
+        tampered = json.loads(json.dumps(sample_credential))
+        tampered['credentialSubject']['stallNumber'] = '999'
+
+        results = verify_credentials_batch([
+            (sample_credential, public_key_multibase),
+            (tampered, public_key_multibase),
+            (sample_credential, public_key_multibase),
+        ])
+        assert results == [True, False, True]
+
+
+class TestVerifyCredentialsParallel:
+    def test_empty_batch(self):
+        assert verify_credentials_parallel([]) == []
+
+    def test_matches_sequential_results(self, sample_credential):
+        issuer_did = sample_credential['issuer']
+        doc = resolve_did_key(issuer_did)
+        public_key_multibase = doc['verificationMethod'][0]['publicKeyMultibase']
+
+        tampered = json.loads(json.dumps(sample_credential))
+        tampered['credentialSubject']['stallNumber'] = '999'
+
+        items = [
+            (sample_credential, public_key_multibase),
+            (tampered, public_key_multibase),
+            (sample_credential, public_key_multibase),
+            (sample_credential, public_key_multibase),
+        ]
+        assert verify_credentials_parallel(items) == verify_credentials_batch(items)
+        assert verify_credentials_parallel(items, max_workers=2) == [True, False, True, True]
+
+    def test_shared_credential_object_is_not_mutated(self, sample_credential):
+        """Concurrent verifies of the *same* dict object must all pass.
+
+        Regression test: verification once popped and restored 'proof'
+        in place, so parallel workers could observe the credential
+        mid-mutation and return a spurious False for a valid farmer.
+        """
+        import sys
+        issuer_did = sample_credential['issuer']
+        doc = resolve_did_key(issuer_did)
+        public_key_multibase = doc['verificationMethod'][0]['publicKeyMultibase']
+
+        items = [(sample_credential, public_key_multibase)] * 16
+        old_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)  # maximize scheduler pressure
+        try:
+            for _ in range(20):
+                assert verify_credentials_parallel(items, max_workers=4) == [True] * 16
+        finally:
+            sys.setswitchinterval(old_interval)
+        assert 'proof' in sample_credential
+
+
 class TestIsCredentialExpired:
     def test_future_expiration_not_expired(self, sample_credential):
         assert is_credential_expired(sample_credential) is False
@@ -0,0 +1,63 @@
+"""Tests for the micro-batching verification worker."""
+import json
+import pytest
+from datetime import datetime, timezone, timedelta
+
+from utils.did_key import generate_did_key, resolve_did_key
+from utils.credential_feira import create_vendor_access_credential, generate_claim_id
+from utils.verify_worker import submit_verification
+
+
+@pytest.fixture(autouse=True)
+def setup_association_keys(monkeypatch):
+    from config import config
+    did, priv = generate_did_key()
+    monkeypatch.setattr(config, 'ASSOCIATION_DID', did)
+    monkeypatch.setattr(config, 'ASSOCIATION_PRIVATE_KEY_BYTES', priv)
+
+
+@pytest.fixture
+def sample_credential():
+    farmer_did, _ = generate_did_key()
+    return create_vendor_access_credential(
+        claim_id=generate_claim_id(),
+        farmer_did=farmer_did,
+        farmer_name='José Pereira da Silva',
+        stall_number='7',
+        products=['Mel'],
+        event_name='Feira Orgânica de Lavras',
+        event_date='2024-06-07',
+        municipality='Lavras',
+        state='MG',
+        opening_time='06:00',
+        closing_time='14:00',
+        valid_until=(datetime.now(timezone.utc) + timedelta(hours=24)).isoformat()
+    )
+
+
+def _issuer_multibase(credential):
+    doc = resolve_did_key(credential['issuer'])
+    return doc['verificationMethod'][0]['publicKeyMultibase']
+
+
+class TestSubmitVerification:
+    def test_valid_credential_resolves_true(self, sample_credential):
+        future = submit_verification(sample_credential, _issuer_multibase(sample_credential))
+        assert future.result(timeout=5) is True
+
+    def test_tampered_credential_resolves_false(self, sample_credential):
+        tampered = json.loads(json.dumps(sample_credential))
+        tampered['credentialSubject']['stallNumber'] = '999'
+        future = submit_verification(tampered, _issuer_multibase(sample_credential))
+        assert future.result(timeout=5) is False
+
+    def test_concurrent_submissions_keep_order(self, sample_credential):
+        multibase = _issuer_multibase(sample_credential)
+        tampered = json.loads(json.dumps(sample_credential))
+        tampered['credentialSubject']['stallNumber'] = '999'
+
+        futures = [
+            submit_verification(cred, multibase)
+            for cred in (sample_credential, tampered, sample_credential)
+        ]
+        assert [f.result(timeout=5) for f in futures] == [True, False, True]
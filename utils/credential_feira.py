@@ -6,17 +6,43 @@ The association signs credentials with its DID:KEY private key.
 Credentials have a short expirationDate (24-48h) matching the market event window.
 """
 
-import json
-import uuid
+import functools
+import secrets
 from datetime import datetime, timezone
 from typing import Optional
 
-from utils.crypto import sign_credential, private_key_from_bytes
+from utils.crypto import sign_credential, private_key_from_bytes, canonical_json
 from config import config
 
+# Constant across every credential — built once at import time instead of
+# per issuance call.
+_VC_CONTEXT = (
+    "https://www.w3.org/2018/credentials/v1",
+    "https://w3id.org/security/suites/ed25519-2020/v1",
+)
+_VC_TYPE = ("VerifiableCredential", "VendorAccessCredential")
+
+
+@functools.lru_cache(maxsize=8)
+def _issuer_signing_material(issuer_did: str, priv_bytes: bytes) -> tuple:
+    """
+    Signing key object and verificationMethod id for an issuer.
+
+    Loading the key and deriving the strings once per issuer — instead
+    of per credential — matters for bulk issuance, where the key load is
+    the expensive part. Keyed on the DID and raw key bytes, so key
+    rotation (or tests swapping the association key) naturally misses
+    the cache.
+    """
+    multibase = issuer_did[len("did:key:"):]
+    verification_method_id = f"{issuer_did}#{multibase}"
+    return private_key_from_bytes(priv_bytes), verification_method_id
+
 
 def generate_claim_id() -> str:
-    return str(uuid.uuid4()).replace('-', '')[:16].upper()
+    # 64 bits of os.urandom as 16 uppercase hex chars — same shape as the
+    # old UUID4-slice id, without building and re-stringifying a UUID.
+    return secrets.token_hex(8).upper()
 
 
 def create_vendor_access_credential(
@@ -82,54 +108,107 @@ def create_vendor_access_credential(
     Returns:
         Signed credential dict (W3C VC with proof).
     """
+    return create_vendor_access_credentials_bulk(
+        [{
+            'claim_id': claim_id,
+            'farmer_did': farmer_did,
+            'farmer_name': farmer_name,
+            'stall_number': stall_number,
+            'products': products,
+        }],
+        event_name=event_name,
+        event_date=event_date,
+        municipality=municipality,
+        state=state,
+        opening_time=opening_time,
+        closing_time=closing_time,
+        valid_until=valid_until,
+    )[0]
+
+
+def create_vendor_access_credentials_bulk(
+    subjects: list,
+    *,
+    event_name: str,
+    event_date: str,
+    municipality: str,
+    state: str,
+    opening_time: str,
+    closing_time: str,
+    valid_until: str,
+) -> list:
+    """
+    Create and sign VendorAccessCredentials for many farmers at once.
+
+    The whole-event issuance path: the timestamp, issuer signing key,
+    verificationMethod id and event block are computed once for the
+    batch instead of once per farmer — only the per-subject dict build
+    and the Ed25519 signature remain in the loop.
+
+    Args:
+        subjects: List of dicts, each with claim_id, farmer_did,
+            farmer_name, stall_number and products.
+        (remaining keyword args as in create_vendor_access_credential)
+
+    Returns:
+        List of signed credential dicts, aligned with subjects.
+    """
     now = datetime.now(timezone.utc).isoformat()
     issuer_did = config.ASSOCIATION_DID
 
     # verificationMethod ID: did:key:{multibase}#{multibase}
-    multibase = issuer_did[len("did:key:"):]
-    verification_method_id = f"{issuer_did}#{multibase}"
+    private_key, verification_method_id = _issuer_signing_material(
+        issuer_did, config.ASSOCIATION_PRIVATE_KEY_BYTES
+    )
+
+    event = {
+        "name": event_name,
+        "date": event_date,
+        "municipality": municipality,
+        "state": state,
+        "openingTime": opening_time,
+        "closingTime": closing_time
+    }
 
-    credential = {
-        "@context": [
-            "https://www.w3.org/2018/credentials/v1",
-            "https://w3id.org/security/suites/ed25519-2020/v1"
-        ],
-        "id": f"{issuer_did}/credentials/{claim_id}",
-        "type": ["VerifiableCredential", "VendorAccessCredential"],
-        "issuer": issuer_did,
-        "issuanceDate": now,
-        "expirationDate": valid_until,
-        "credentialSubject": {
-            "id": farmer_did,
-            "farmerName": farmer_name,
-            "stallNumber": stall_number,
-            "products": products,
-            "event": {
-                "name": event_name,
-                "date": event_date,
-                "municipality": municipality,
-                "state": state,
-                "openingTime": opening_time,
-                "closingTime": closing_time
+    credentials = []
+    for subject in subjects:
+        credential = {
+            # Shared tuples: every JSON serializer in play (orjson, stdlib
+            # json, the Supabase client) emits tuples as arrays, and nothing
+            # downstream mutates these two fields.
+            "@context": _VC_CONTEXT,
+            "id": f"{issuer_did}/credentials/{subject['claim_id']}",
+            "type": _VC_TYPE,
+            "issuer": issuer_did,
+            "issuanceDate": now,
+            "expirationDate": valid_until,
+            "credentialSubject": {
+                "id": subject['farmer_did'],
+                "farmerName": subject['farmer_name'],
+                "stallNumber": subject['stall_number'],
+                "products": subject['products'],
+                "event": dict(event)
             }
         }
-    }
 
-    private_key = private_key_from_bytes(config.ASSOCIATION_PRIVATE_KEY_BYTES)
-    jws = sign_credential(credential, private_key)
+        jws = sign_credential(credential, private_key)
 
-    credential["proof"] = {
-        "type": "Ed25519Signature2020",
-        "created": now,
-        "verificationMethod": verification_method_id,
-        "proofPurpose": "assertionMethod",
-        "jws": jws
-    }
+        credential["proof"] = {
+            "type": "Ed25519Signature2020",
+            "created": now,
+            "verificationMethod": verification_method_id,
+            "proofPurpose": "assertionMethod",
+            "jws": jws
+        }
+        credentials.append(credential)
 
-    return credential
+    return credentials
 
 
 def credential_to_json(credential: dict) -> str:
     """Serialize credential to canonical JSON (sort_keys=True).
-    Must use TEXT storage in DB — never JSONB — to preserve key order for signature verification."""
-    return json.dumps(credential, sort_keys=True, separators=(',', ':'))
+
+    Storage no longer depends on this: credential_json is jsonb and
+    verification re-canonicalizes the dict before checking the
+    signature, so key order in transit/storage is irrelevant."""
+    return canonical_json(credential).decode('utf-8')
@@ -14,7 +14,17 @@ No HTTP request, no server, no infrastructure — works 100% offline.
         did:web:domain:path  →  GET https://domain/path/did.json  (requires server)
 """
 
+import functools
+
 import base58
+
+try:
+    # Optional Rust-backed base58 (~10x the pure-Python package); the
+    # b58encode/b58decode API is interchangeable for bytes input.
+    import based58 as _b58
+except ImportError:
+    _b58 = base58
+
 from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
 from cryptography.hazmat.primitives.serialization import (
     Encoding, PublicFormat, PrivateFormat, NoEncryption
@@ -23,6 +33,13 @@ from cryptography.hazmat.primitives.serialization import (
 # Multicodec prefix for Ed25519 public key (0xed 0x01)
 MULTICODEC_ED25519_PREFIX = b'\xed\x01'
 
+# The @context block is identical for every DID Document — share one
+# instance across cache entries (documents are read-only by contract).
+_DID_DOC_CONTEXT = (
+    "https://www.w3.org/ns/did/v1",
+    "https://w3id.org/security/suites/ed25519-2020/v1",
+)
+
 
 def generate_did_key() -> tuple:
     """
@@ -52,13 +69,17 @@ def did_from_private_bytes(priv_bytes: bytes) -> str:
     return f"did:key:{multibase}"
 
 
+@functools.lru_cache(maxsize=4096)
 def resolve_did_key(did: str) -> dict:
     """
     Derive the DID Document from a DID:KEY — no HTTP, no server, offline.
 
     The DID Document is fully deterministic: given the same DID:KEY,
     the same document is always produced. The public key is embedded
-    in the DID identifier itself.
+    in the DID identifier itself. Results are memoized per DID — at the
+    gate the same association issuer is resolved for every credential
+    scanned, so repeat resolutions are a dict lookup. Callers must treat
+    the returned document as read-only.
 
     Args:
         did: A DID:KEY string, e.g. "did:key:z6MkhaXgBZDvotzL8L7XYKn..."
@@ -74,13 +95,10 @@ def resolve_did_key(did: str) -> dict:
         raise ValueError(f"Not a did:key: {did}")
 
     multibase = did[len("did:key:"):]
-    vm_id = f"{did}#{multibase}"
+    vm_id = "%s#%s" % (did, multibase)
 
     return {
-        "@context": [
-            "https://www.w3.org/ns/did/v1",
-            "https://w3id.org/security/suites/ed25519-2020/v1"
-        ],
+        "@context": _DID_DOC_CONTEXT,
         "id": did,
         "verificationMethod": [
             {
@@ -97,4 +115,4 @@ def resolve_did_key(did: str) -> dict:
 
 def _pub_bytes_to_multibase(pub_bytes: bytes) -> str:
     """Encode raw Ed25519 public key bytes as multibase base58btc."""
-    return 'z' + base58.b58encode(MULTICODEC_ED25519_PREFIX + pub_bytes).decode('utf-8')
+    return 'z' + _b58.b58encode(MULTICODEC_ED25519_PREFIX + pub_bytes).decode('utf-8')